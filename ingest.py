@@ -9,22 +9,35 @@ Usage:
     python ingest.py                    # Process all exports
     python ingest.py --latest           # Process only latest files
     python ingest.py --stats            # Show database statistics
+    python ingest.py --emit-parquet     # Process, then mirror tables to parquet/
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
+import functools
+import itertools
 import json
 import logging
+import operator
 import re
 import sqlite3
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import pendulum
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is used when missing
+    orjson = None
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import pendulum as pendulum_type
 
 # =============================================================================
@@ -34,12 +47,26 @@ if TYPE_CHECKING:
 CURRENT_DIR = Path(__file__).resolve().parent
 EXPORTS_DIR = CURRENT_DIR / "exports"
 DB_PATH = CURRENT_DIR / "interactions.db"
+PARQUET_DIR = CURRENT_DIR / "parquet"
 
-MONTH_NAMES = [
+MONTH_NAMES = (
     "January", "February", "March", "April", "May", "June",
     "July", "August", "September", "October", "November", "December",
-]
-DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+)
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+DATETIME_FORMATS = ("%m-%d-%Y %H:%M:%S", "%Y-%m-%d %H:%M:%S")
+USER_FIELD_PATTERN = re.compile(r"^(.+?)\s*\(([^)]+)\)$")
+JSON_LOADS = orjson.loads if orjson else json.loads
+BATCH_SIZE = 10_000  # records transformed and loaded together
+
+# CSV columns read by the extractors, in the order the transforms unpack them.
+INTERACTION_COLUMNS = (
+    "number", "short_description", "type", "work_notes", "state", "location",
+    "opened_for", "assigned_to", "opened_at", "sys_updated_on",
+)
+IMS_INC_COLUMNS = ("interaction", "task", "sys_created_by", "sys_created_on")
+SYSID_KEY_SEPARATOR = "\x1f"  # ASCII unit separator; never appears in user ids or timestamps
 
 logging.basicConfig(
     level=logging.INFO,
@@ -115,12 +142,30 @@ CREATE TABLE IF NOT EXISTS bridge_ims_inc (
     incident_sysid TEXT,
     created_by TEXT,
     created_on TEXT,
-    interaction_url TEXT,
-    incident_url TEXT,
     ingested_at TEXT DEFAULT (datetime('now')),
     UNIQUE(interaction_number, incident_number)
 );
 
+CREATE VIEW IF NOT EXISTS v_bridge_ims_inc AS
+SELECT
+    link_id,
+    interaction_number,
+    incident_number,
+    interaction_sysid,
+    incident_sysid,
+    created_by,
+    created_on,
+    CASE WHEN interaction_sysid <> ''
+        THEN 'https://example.service-now.com/interaction.do?sys_id=' || interaction_sysid
+    END AS interaction_url,
+    CASE WHEN incident_sysid <> ''
+        THEN 'https://example.service-now.com/incident.do?sys_id=' || incident_sysid
+    END AS incident_url,
+    ingested_at
+FROM bridge_ims_inc;
+"""
+
+INDEX_SQL = """
 CREATE INDEX IF NOT EXISTS idx_fact_opened_date ON fact_interactions(opened_date_id);
 CREATE INDEX IF NOT EXISTS idx_fact_location ON fact_interactions(location_id);
 CREATE INDEX IF NOT EXISTS idx_fact_tech ON fact_interactions(tech_id);
@@ -129,6 +174,42 @@ CREATE INDEX IF NOT EXISTS idx_bridge_ims ON bridge_ims_inc(interaction_number);
 CREATE INDEX IF NOT EXISTS idx_bridge_inc ON bridge_ims_inc(incident_number);
 """
 
+DROP_INDEX_SQL = """
+DROP INDEX IF EXISTS idx_fact_opened_date;
+DROP INDEX IF EXISTS idx_fact_location;
+DROP INDEX IF EXISTS idx_fact_tech;
+DROP INDEX IF EXISTS idx_fact_state;
+DROP INDEX IF EXISTS idx_bridge_ims;
+DROP INDEX IF EXISTS idx_bridge_inc;
+"""
+
+INSERT_USER_SQL = "INSERT INTO dim_users (user_id, user_name) VALUES (?, ?)"
+INSERT_TECH_SQL = "INSERT INTO dim_technicians (tech_id, tech_name) VALUES (?, ?)"
+INSERT_LOCATION_SQL = "INSERT INTO dim_locations (location_name) VALUES (?)"
+INSERT_STATE_SQL = "INSERT INTO dim_states (state_name) VALUES (?)"
+
+INSERT_DATE_SQL = """
+INSERT OR IGNORE INTO dim_dates
+(date_id, full_date, year, quarter, month, month_name, week_of_year,
+ day_of_month, day_of_week, day_name, is_weekend)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_FACT_SQL = """
+INSERT OR REPLACE INTO fact_interactions
+(interaction_number, short_description, interaction_type, work_notes,
+ user_id, tech_id, location_id, state_id, opened_date_id,
+ opened_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_LINK_SQL = """
+INSERT OR IGNORE INTO bridge_ims_inc
+(interaction_number, incident_number, interaction_sysid, incident_sysid,
+ created_by, created_on)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
 # =============================================================================
 # Extract
@@ -149,41 +230,81 @@ def find_latest_file(pattern: str, exports_dir: Path | None = None) -> Path | No
     return files[0] if files else None
 
 
-def extract_interactions_csv(file_path: Path) -> list[dict[str, str]]:
-    """Extract interaction records from a CSV file.
+def read_csv_columns(file_path: Path, columns: tuple[str, ...]) -> Iterator[tuple[str, ...]]:
+    """Yield selected columns of each CSV row as a tuple, in ``columns`` order.
+
+    Uses a positional ``csv.reader`` rather than ``csv.DictReader`` so no
+    per-row dict is built. Columns missing from the header, and trailing
+    fields missing from short rows, read as empty strings. Blank lines are
+    skipped.
 
     Args:
-        file_path: Path to the interactions CSV file.
+        file_path: Path to a CSV file with a header row.
+        columns: Header names to select.
 
-    Returns:
-        List of row dicts with raw string values.
+    Yields:
+        Tuples of raw string values.
     """
-    records: list[dict[str, str]] = []
     with file_path.open(encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        index = {name: i for i, name in enumerate(header)}
+        # Absent columns read slot len(header), which is forced to "" below.
+        missing = not set(columns) <= index.keys()
+        width = len(header) + 1 if missing else len(header)
+        positions = [index.get(name, len(header)) for name in columns]
+        if len(positions) == 1:
+            # itemgetter with a single index returns the bare value, not a 1-tuple.
+            position = positions[0]
+
+            def getter(row: list[str]) -> tuple[str, ...]:
+                return (row[position],)
+
+        else:
+            getter = operator.itemgetter(*positions)
         for row in reader:
-            records.append(dict(row))
-    logger.info("Extracted %d interactions from %s", len(records), file_path.name)
-    return records
+            if not row:
+                continue
+            if missing or len(row) < width:
+                del row[len(header):]
+                row.extend([""] * (width - len(row)))
+            yield getter(row)
+
+
+def extract_interactions_csv(file_path: Path) -> Iterator[tuple[str, ...]]:
+    """Extract interaction records from a CSV file.
+
+    Rows are yielded lazily so the file is never held in memory as a whole.
+
+    Args:
+        file_path: Path to the interactions CSV file.
 
+    Yields:
+        Tuples of raw string values ordered as INTERACTION_COLUMNS.
+    """
+    count = 0
+    for row in read_csv_columns(file_path, INTERACTION_COLUMNS):
+        count += 1
+        yield row
+    logger.info("Extracted %d interactions from %s", count, file_path.name)
 
-def extract_ims_inc_csv(file_path: Path) -> list[dict[str, str]]:
+
+def extract_ims_inc_csv(file_path: Path) -> Iterator[tuple[str, ...]]:
     """Extract IMS-INC mapping records from a CSV file.
 
+    Rows are yielded lazily so the file is never held in memory as a whole.
+
     Args:
         file_path: Path to the IMS-INC CSV file.
 
-    Returns:
-        List of row dicts with keys: interaction, task, sys_created_by,
-        sys_created_on, document_id.
+    Yields:
+        Tuples of raw string values ordered as IMS_INC_COLUMNS.
     """
-    records: list[dict[str, str]] = []
-    with file_path.open(encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            records.append(dict(row))
-    logger.info("Extracted %d IMS-INC links from %s", len(records), file_path.name)
-    return records
+    count = 0
+    for row in read_csv_columns(file_path, IMS_INC_COLUMNS):
+        count += 1
+        yield row
+    logger.info("Extracted %d IMS-INC links from %s", count, file_path.name)
 
 
 def extract_sysid_json(file_path: Path) -> list[dict[str, str]]:
@@ -194,16 +315,19 @@ def extract_sysid_json(file_path: Path) -> list[dict[str, str]]:
     - Wrapped format: {"records": [{...}, ...]}
     - NDJSON (newline-delimited): one JSON object per line
 
+    The file is parsed from raw bytes with orjson when it is installed,
+    falling back to the standard library json module.
+
     Args:
         file_path: Path to the sysid JSON file.
 
     Returns:
         List of record dicts.
     """
-    content = file_path.read_text(encoding="utf-8").strip()
+    content = file_path.read_bytes()
 
     try:
-        raw_data = json.loads(content)
+        raw_data = JSON_LOADS(content)
         if isinstance(raw_data, dict) and "records" in raw_data:
             data: list[dict[str, str]] = raw_data["records"]
         elif isinstance(raw_data, list):
@@ -215,7 +339,7 @@ def extract_sysid_json(file_path: Path) -> list[dict[str, str]]:
         for line in content.splitlines():
             line = line.strip()
             if line:
-                data.append(json.loads(line))
+                data.append(JSON_LOADS(line))
 
     logger.info("Extracted %d sys_id records from %s", len(data), file_path.name)
     return data
@@ -225,26 +349,36 @@ def extract_sysid_json(file_path: Path) -> list[dict[str, str]]:
 # Transform
 # =============================================================================
 
+@functools.lru_cache(maxsize=65536)
 def parse_user_field(value: str) -> tuple[str | None, str | None]:
     """Parse 'Name (user_id)' format into (user_id, name).
 
+    Results are memoized: the same technician or requester appears on many
+    rows, so each distinct value only goes through the regex once.
+
     Args:
         value: Raw field value from CSV, e.g. "Jackie Phrakousonh (j0p0u94)".
 
     Returns:
         Tuple of (user_id, display_name), or (None, None) if empty or unmatched.
     """
-    if not value or not value.strip():
+    value = value.strip() if value else ""
+    if not value:
         return None, None
-    match = re.match(r"^(.+?)\s*\(([^)]+)\)$", value.strip())
+    match = USER_FIELD_PATTERN.match(value)
     if match:
         return match.group(2), match.group(1).strip()
-    return None, value.strip()
+    return None, value
 
 
+@functools.lru_cache(maxsize=65536)
 def parse_datetime(dt_str: str) -> pendulum.DateTime | None:
     """Parse a datetime string into a Pendulum DateTime.
 
+    Results are memoized: exports carry minute-resolution timestamps and
+    bulk-updated tickets share sys_updated_on values, so repeats skip
+    strptime entirely. DateTime objects are immutable, so sharing is safe.
+
     Supports formats:
     - MM-DD-YYYY HH:MM:SS
     - YYYY-MM-DD HH:MM:SS
@@ -257,13 +391,16 @@ def parse_datetime(dt_str: str) -> pendulum.DateTime | None:
     """
     if not dt_str or not dt_str.strip():
         return None
-    for fmt in ("%m-%d-%Y %H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+    value = dt_str.strip()
+    # Try the format matching the string's layout first so the common case
+    # does not go through a failed strptime and its exception.
+    formats = DATETIME_FORMATS if value[4:5] != "-" else DATETIME_FORMATS[::-1]
+    for fmt in formats:
         try:
-            import datetime as _dt
-            native = _dt.datetime.strptime(dt_str.strip(), fmt)  # noqa: DTZ007 - source data has no tz info
-            return pendulum.instance(native, tz="UTC")
+            native = datetime.strptime(value, fmt)  # noqa: DTZ007 - source data has no tz info
         except ValueError:
             continue
+        return pendulum.instance(native, tz="UTC")
     return None
 
 
@@ -276,101 +413,149 @@ def create_date_key(dt: pendulum.DateTime) -> int:
     Returns:
         Integer date key, e.g. 20250318.
     """
-    return int(dt.format("YYYYMMDD"))
+    return dt.year * 10000 + dt.month * 100 + dt.day
 
 
-def transform_interaction(row: dict[str, str]) -> dict[str, str | int | None]:
-    """Transform a raw CSV row into a normalized interaction record.
+class InteractionRecord(NamedTuple):
+    """Transformed interaction, ordered like the fact_interactions insert.
+
+    location and state carry dimension names that are swapped for surrogate
+    ids at load time; user_name and tech_name only feed the dimension tables.
+    """
 
-    Extracts user_id and tech_id from formatted strings, parses timestamps,
-    and prepares dimension lookups.
+    interaction_number: str
+    short_description: str
+    interaction_type: str
+    work_notes: str
+    user_id: str | None
+    tech_id: str | None
+    location: str
+    state: str
+    opened_date_key: int | None
+    opened_at: str | None
+    updated_at: str | None
+    user_name: str | None
+    tech_name: str | None
+
+
+def transform_interactions(rows: list[tuple[str, ...]]) -> list[InteractionRecord]:
+    """Transform a batch of raw CSV rows into normalized interaction records.
+
+    The batch is transposed into one list per column and each column is
+    transformed in a single pass (user fields parsed, timestamps converted,
+    key and dimension fields stripped; free-text fields are stored as
+    exported). The columns are then zipped back into records.
 
     Args:
-        row: Raw CSV row dict.
+        rows: Raw CSV rows, each ordered as INTERACTION_COLUMNS.
 
     Returns:
-        Transformed record dict ready for database loading.
+        Transformed records ready for database loading, in input order.
     """
-    user_id, user_name = parse_user_field(row.get("opened_for", ""))
-    tech_id, tech_name = parse_user_field(row.get("assigned_to", ""))
-    opened_dt = parse_datetime(row.get("opened_at", ""))
-    updated_dt = parse_datetime(row.get("sys_updated_on", ""))
-
-    return {
-        "interaction_number": row.get("number", "").strip(),
-        "short_description": row.get("short_description", "").strip(),
-        "interaction_type": row.get("type", "").strip(),
-        "work_notes": row.get("work_notes", "").strip(),
-        "state": row.get("state", "").strip(),
-        "location": row.get("location", "").strip(),
-        "user_id": user_id,
-        "user_name": user_name,
-        "tech_id": tech_id,
-        "tech_name": tech_name,
-        "opened_at": opened_dt.to_iso8601_string() if opened_dt else None,
-        "updated_at": updated_dt.to_iso8601_string() if updated_dt else None,
-        "opened_date_key": create_date_key(opened_dt) if opened_dt else None,
-    }
+    if not rows:
+        return []
+    (
+        numbers,
+        short_descriptions,
+        interaction_types,
+        work_notes,
+        states,
+        locations,
+        opened_for,
+        assigned_to,
+        opened_at,
+        updated_on,
+    ) = zip(*rows, strict=True)
+
+    users = list(map(parse_user_field, opened_for))
+    techs = list(map(parse_user_field, assigned_to))
+    opened = list(map(parse_datetime, opened_at))
+    updated = map(parse_datetime, updated_on)
+
+    return list(
+        map(
+            InteractionRecord._make,
+            zip(
+                map(str.strip, numbers),
+                short_descriptions,
+                map(str.strip, interaction_types),
+                work_notes,
+                (user_id for user_id, _ in users),
+                (tech_id for tech_id, _ in techs),
+                map(str.strip, locations),
+                map(str.strip, states),
+                (create_date_key(dt) if dt else None for dt in opened),
+                (dt.to_iso8601_string() if dt else None for dt in opened),
+                (dt.to_iso8601_string() if dt else None for dt in updated),
+                (user_name for _, user_name in users),
+                (tech_name for _, tech_name in techs),
+                strict=True,
+            ),
+        )
+    )
+
+
+class LinkRecord(NamedTuple):
+    """Transformed IMS-INC link, ordered like the bridge_ims_inc insert."""
+
+    interaction_number: str
+    incident_number: str
+    interaction_sysid: str
+    incident_sysid: str
+    created_by: str
+    created_on: str
 
 
 def transform_ims_inc_link(
-    csv_row: dict[str, str],
-    sysid_lookup: dict[tuple[str, str], dict[str, str]],
-) -> dict[str, str | None]:
+    csv_row: tuple[str, ...],
+    sysid_lookup: dict[str, dict[str, str]],
+) -> LinkRecord:
     """Transform an IMS-INC CSV row with optional sys_id enrichment.
 
     Args:
-        csv_row: Dict from IMS-INC CSV.
-        sysid_lookup: Dict mapping (created_by, created_on) to sys_id record.
+        csv_row: Raw CSV values ordered as IMS_INC_COLUMNS.
+        sysid_lookup: Dict from build_sysid_lookup, keyed by created_by and
+            created_on joined with SYSID_KEY_SEPARATOR.
 
     Returns:
-        Transformed link record with URLs if sys_ids are available.
+        Transformed link record. Ticket URLs are not stored; the
+        v_bridge_ims_inc view derives them from the sys_ids.
     """
-    key = (csv_row.get("sys_created_by", ""), csv_row.get("sys_created_on", ""))
+    interaction, task, created_by, created_on = csv_row
+    key = (created_by or "") + SYSID_KEY_SEPARATOR + (created_on or "")
     sysid_data = sysid_lookup.get(key, {})
 
-    interaction_sysid = sysid_data.get("interaction", "")
-    incident_sysid = sysid_data.get("task", "")
-
-    base_url = "https://example.service-now.com"
-    interaction_url = (
-        f"{base_url}/interaction.do?sys_id={interaction_sysid}"
-        if interaction_sysid
-        else None
+    return LinkRecord(
+        interaction_number=interaction.strip(),
+        incident_number=task.strip(),
+        interaction_sysid=sysid_data.get("interaction", ""),
+        incident_sysid=sysid_data.get("task", ""),
+        created_by=created_by.strip(),
+        created_on=created_on.strip(),
     )
-    incident_url = (
-        f"{base_url}/incident.do?sys_id={incident_sysid}"
-        if incident_sysid
-        else None
-    )
-
-    return {
-        "interaction_number": csv_row.get("interaction", "").strip(),
-        "incident_number": csv_row.get("task", "").strip(),
-        "interaction_sysid": interaction_sysid,
-        "incident_sysid": incident_sysid,
-        "created_by": csv_row.get("sys_created_by", "").strip(),
-        "created_on": csv_row.get("sys_created_on", "").strip(),
-        "interaction_url": interaction_url,
-        "incident_url": incident_url,
-    }
 
 
 def build_sysid_lookup(
     sysid_records: list[dict[str, str]],
-) -> dict[tuple[str, str], dict[str, str]]:
+) -> dict[str, dict[str, str]]:
     """Build a lookup dict from sys_id records keyed by (created_by, created_on).
 
+    The two fields are joined with SYSID_KEY_SEPARATOR into a single string
+    key, which is cheaper to hash than a tuple.
+
     Args:
         sysid_records: List of raw sysid record dicts.
 
     Returns:
-        Dict mapping (created_by, created_on) tuples to record dicts.
+        Dict mapping "created_by<US>created_on" keys to record dicts.
     """
-    lookup: dict[tuple[str, str], dict[str, str]] = {}
+    lookup: dict[str, dict[str, str]] = {}
     for record in sysid_records:
-        key = (record.get("sys_created_by", ""), record.get("sys_created_on", ""))
-        lookup[key] = record
+        # JSON exports may carry null or non-string values; treat them like
+        # missing fields instead of failing the string join.
+        created_by = str(record.get("sys_created_by") or "")
+        created_on = str(record.get("sys_created_on") or "")
+        lookup[created_by + SYSID_KEY_SEPARATOR + created_on] = record
     return lookup
 
 
@@ -381,189 +566,238 @@ def build_sysid_lookup(
 def init_database(db_path: Path) -> sqlite3.Connection:
     """Initialize the SQLite database with the star schema.
 
+    Secondary indexes (INDEX_SQL) are not created here; run_etl builds them
+    before or after loading depending on whether the load is an initial one.
+
     Args:
         db_path: Path where the SQLite database file will be created.
 
     Returns:
-        Open database connection with WAL mode and foreign keys enabled.
+        Open database connection with WAL mode, foreign keys enabled, and
+        pragmas tuned for bulk loading. The connection is in autocommit mode;
+        loaders group their writes with transaction().
     """
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None)
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
+    # WAL + NORMAL only fsyncs at checkpoints; a crash can lose the last
+    # transaction but not corrupt the file, and re-running the ETL is idempotent.
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -262144")  # 256 MiB
+    conn.execute("PRAGMA mmap_size = 1073741824")  # 1 GiB
     conn.executescript(SCHEMA_SQL)
-    conn.commit()
     logger.info("Database initialized: %s", db_path)
     return conn
 
 
-def load_dimension_date(conn: sqlite3.Connection, date_key: int | None) -> None:
-    """Insert a date dimension record if it does not already exist.
+@contextlib.contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed statements in one explicit transaction.
+
+    Commits on success and rolls back if the block raises.
+
+    Args:
+        conn: SQLite connection opened with ``isolation_level=None``.
+
+    Yields:
+        The same connection.
+    """
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def load_dimension_dates(conn: sqlite3.Connection, date_keys: Iterable[int]) -> int:
+    """Insert date dimension records for a set of date keys.
+
+    Calendar attributes are computed once per distinct key and written with a
+    single ``executemany``; keys that already exist are ignored. Runs inside
+    the caller's transaction.
 
     Args:
         conn: Active SQLite connection.
-        date_key: Integer date in YYYYMMDD format, or None to skip.
+        date_keys: Distinct integer dates in YYYYMMDD format.
+
+    Returns:
+        Number of date rows inserted.
     """
-    if not date_key:
-        return
-
-    cursor = conn.execute("SELECT 1 FROM dim_dates WHERE date_id = ?", (date_key,))
-    if cursor.fetchone():
-        return
-
-    import datetime as _dt
-    dt = _dt.datetime.strptime(str(date_key), "%Y%m%d")  # noqa: DTZ007 - no tz needed for date-only keys
-
-    conn.execute(
-        """
-        INSERT OR IGNORE INTO dim_dates
-        (date_id, full_date, year, quarter, month, month_name, week_of_year,
-         day_of_month, day_of_week, day_name, is_weekend)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            date_key,
-            dt.strftime("%Y-%m-%d"),
-            dt.year,
-            (dt.month - 1) // 3 + 1,
-            dt.month,
-            MONTH_NAMES[dt.month - 1],
-            dt.isocalendar()[1],
-            dt.day,
-            dt.weekday(),
-            DAY_NAMES[dt.weekday()],
-            1 if dt.weekday() >= 5 else 0,
-        ),
-    )
+    rows = []
+    for date_key in date_keys:
+        dt = datetime.strptime(str(date_key), "%Y%m%d")  # noqa: DTZ007 - no tz needed for date-only keys
+        rows.append(
+            (
+                date_key,
+                dt.strftime("%Y-%m-%d"),
+                dt.year,
+                (dt.month - 1) // 3 + 1,
+                dt.month,
+                MONTH_NAMES[dt.month - 1],
+                dt.isocalendar()[1],
+                dt.day,
+                dt.weekday(),
+                DAY_NAMES[dt.weekday()],
+                1 if dt.weekday() >= 5 else 0,
+            )
+        )
 
+    return conn.executemany(INSERT_DATE_SQL, rows).rowcount
 
-def load_interactions(
+
+def load_dimension_ids(
     conn: sqlite3.Connection,
-    interactions: list[dict[str, str | int | None]],
+    insert_sql: str,
+    names: Iterable[str],
+    ids: dict[str, int],
 ) -> None:
-    """Load transformed interaction records into the database.
+    """Insert dimension names missing from an id cache and record their ids.
 
-    Upserts dimension records for users, technicians, locations, states, and
-    dates, then inserts fact rows.
+    The cache is read from the table once by the caller, so each name costs
+    at most one INSERT instead of an INSERT plus a SELECT round-trip.
 
     Args:
         conn: Active SQLite connection.
-        interactions: List of transformed interaction dicts.
+        insert_sql: Single-parameter INSERT for the dimension's name column,
+            e.g. INSERT_LOCATION_SQL.
+        names: Names that must be present in ``ids`` afterwards.
+        ids: Cache mapping known names to surrogate ids; updated in place.
     """
-    count = 0
-    for record in interactions:
-        if record["user_id"] and record["user_name"]:
-            conn.execute(
-                "INSERT OR IGNORE INTO dim_users (user_id, user_name) VALUES (?, ?)",
-                (record["user_id"], record["user_name"]),
-            )
+    for name in names:
+        if name not in ids:
+            ids[name] = conn.execute(insert_sql, (name,)).lastrowid  # type: ignore[assignment]
 
-        if record["tech_id"] and record["tech_name"]:
-            conn.execute(
-                "INSERT OR IGNORE INTO dim_technicians (tech_id, tech_name) VALUES (?, ?)",
-                (record["tech_id"], record["tech_name"]),
-            )
 
-        location_id = None
-        if record["location"]:
-            conn.execute(
-                "INSERT OR IGNORE INTO dim_locations (location_name) VALUES (?)",
-                (record["location"],),
-            )
-            cursor = conn.execute(
-                "SELECT location_id FROM dim_locations WHERE location_name = ?",
-                (record["location"],),
+def load_interactions(
+    conn: sqlite3.Connection,
+    batches: Iterable[list[InteractionRecord]],
+) -> None:
+    """Load batches of transformed interaction records into the database.
+
+    For each batch, new users, technicians, locations, states, and dates are
+    inserted (first occurrence wins), then the fact rows are written with one
+    ``executemany``. The whole load runs in a single transaction.
+
+    Args:
+        conn: Active SQLite connection.
+        batches: Iterable of transformed record batches, e.g. from
+            transform_interactions.
+    """
+    known_users = {row[0] for row in conn.execute("SELECT user_id FROM dim_users")}
+    known_techs = {row[0] for row in conn.execute("SELECT tech_id FROM dim_technicians")}
+    known_dates = {row[0] for row in conn.execute("SELECT date_id FROM dim_dates")}
+    location_ids = dict(conn.execute("SELECT location_name, location_id FROM dim_locations"))
+    state_ids = dict(conn.execute("SELECT state_name, state_id FROM dim_states"))
+
+    loaded = new_users = new_techs = new_dates = 0
+    with transaction(conn):
+        for batch in batches:
+            users: dict[str, str] = {}
+            technicians: dict[str, str] = {}
+            date_keys: dict[int, None] = {}
+            for record in batch:
+                if record.user_id and record.user_name and record.user_id not in known_users:
+                    users.setdefault(record.user_id, record.user_name)
+                if record.tech_id and record.tech_name and record.tech_id not in known_techs:
+                    technicians.setdefault(record.tech_id, record.tech_name)
+                if record.opened_date_key and record.opened_date_key not in known_dates:
+                    date_keys.setdefault(record.opened_date_key)
+
+            conn.executemany(INSERT_USER_SQL, users.items())
+            conn.executemany(INSERT_TECH_SQL, technicians.items())
+            new_dates += load_dimension_dates(conn, date_keys)
+            load_dimension_ids(
+                conn, INSERT_LOCATION_SQL, (r.location for r in batch if r.location), location_ids
             )
-            row = cursor.fetchone()
-            if row:
-                location_id = row[0]
-
-        state_id = None
-        if record["state"]:
-            conn.execute(
-                "INSERT OR IGNORE INTO dim_states (state_name) VALUES (?)",
-                (record["state"],),
+            load_dimension_ids(
+                conn, INSERT_STATE_SQL, (r.state for r in batch if r.state), state_ids
             )
-            cursor = conn.execute(
-                "SELECT state_id FROM dim_states WHERE state_name = ?",
-                (record["state"],),
+            known_users.update(users)
+            known_techs.update(technicians)
+            known_dates.update(date_keys)
+            new_users += len(users)
+            new_techs += len(technicians)
+
+            # Fields 6 and 7 are the location/state names; swap in their ids.
+            # The generator is drained by executemany's C loop, so no second
+            # list of fact tuples is built alongside the batch.
+            conn.executemany(
+                INSERT_FACT_SQL,
+                (
+                    (*r[:6], location_ids.get(r.location), state_ids.get(r.state), *r[8:11])
+                    for r in batch
+                ),
             )
-            row = cursor.fetchone()
-            if row:
-                state_id = row[0]
-
-        load_dimension_date(conn, record["opened_date_key"])  # type: ignore[arg-type]
-
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO fact_interactions
-            (interaction_number, short_description, interaction_type, work_notes,
-             user_id, tech_id, location_id, state_id, opened_date_id,
-             opened_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                record["interaction_number"],
-                record["short_description"],
-                record["interaction_type"],
-                record["work_notes"],
-                record["user_id"],
-                record["tech_id"],
-                location_id,
-                state_id,
-                record["opened_date_key"],
-                record["opened_at"],
-                record["updated_at"],
-            ),
-        )
-        count += 1
-
-    conn.commit()
-    logger.info("Loaded %d interactions", count)
+            loaded += len(batch)
+
+    logger.info(
+        "Loaded %d interactions (%d new users, %d new technicians, %d new dates)",
+        loaded,
+        new_users,
+        new_techs,
+        new_dates,
+    )
 
 
 def load_ims_inc_links(
     conn: sqlite3.Connection,
-    links: list[dict[str, str | None]],
+    links: Iterable[LinkRecord],
 ) -> None:
     """Load IMS-INC link records into the bridge table.
 
+    Links are streamed straight into ``executemany``. Duplicate
+    (interaction, incident) pairs are skipped by the table's UNIQUE
+    constraint.
+
     Args:
         conn: Active SQLite connection.
-        links: List of transformed link dicts.
+        links: Iterable of transformed link records.
     """
-    inserted = 0
-    for link in links:
-        try:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO bridge_ims_inc
-                (interaction_number, incident_number, interaction_sysid, incident_sysid,
-                 created_by, created_on, interaction_url, incident_url)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    link["interaction_number"],
-                    link["incident_number"],
-                    link["interaction_sysid"],
-                    link["incident_sysid"],
-                    link["created_by"],
-                    link["created_on"],
-                    link["interaction_url"],
-                    link["incident_url"],
-                ),
-            )
-            inserted += 1
-        except sqlite3.IntegrityError:
-            pass  # Duplicate — skip silently
+    with transaction(conn):
+        cursor = conn.executemany(INSERT_LINK_SQL, links)
 
-    conn.commit()
-    logger.info("Loaded %d IMS-INC links", inserted)
+    logger.info("Loaded %d IMS-INC links", cursor.rowcount)
 
 
 # =============================================================================
 # ETL Pipeline
 # =============================================================================
 
+def iter_batches(
+    rows: Iterable[tuple[str, ...]],
+    size: int,
+) -> Iterator[list[tuple[str, ...]]]:
+    """Group extracted rows into lists of at most ``size`` rows.
+
+    Args:
+        rows: Extracted CSV rows; consumed lazily.
+        size: Maximum batch length.
+
+    Yields:
+        Consecutive non-empty batches.
+    """
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def rebuild_indexes(conn: sqlite3.Connection, completed: bool) -> None:
+    """Create secondary indexes after an initial load.
+
+    If the load itself failed, an index error is logged rather than raised so
+    the load's own exception is the one that propagates.
+    """
+    try:
+        conn.executescript(INDEX_SQL)
+    except sqlite3.Error:
+        if completed:
+            raise
+        logger.exception("Could not rebuild secondary indexes after a failed load")
+
+
 def run_etl(
     interactions_csv: Path | None = None,
     ims_inc_csv: Path | None = None,
@@ -573,7 +807,9 @@ def run_etl(
     """Run the complete ETL pipeline.
 
     Finds export files, initializes the database, and runs extract-transform-load
-    for interactions, sys_ids, and IMS-INC links.
+    for interactions, sys_ids, and IMS-INC links. When the fact and bridge tables
+    are empty (an initial load), secondary indexes are built once after the
+    data is inserted; incremental runs ensure they exist before loading.
 
     Args:
         interactions_csv: Path to interactions CSV. Auto-detected if None.
@@ -593,17 +829,28 @@ def run_etl(
         sysid_json = find_latest_file("sysid_*.json", exports_dir)
 
     conn = init_database(DB_PATH)
+    initial_load = not conn.execute(
+        "SELECT EXISTS (SELECT 1 FROM fact_interactions)"
+        " OR EXISTS (SELECT 1 FROM bridge_ims_inc)"
+    ).fetchone()[0]
 
+    completed = False
     try:
+        if initial_load:
+            logger.info("Initial load: building secondary indexes after insert")
+            # Only present if an earlier run created them on a still-empty database.
+            conn.executescript(DROP_INDEX_SQL)
+        else:
+            conn.executescript(INDEX_SQL)
+
         if interactions_csv and interactions_csv.exists():
             logger.info("[1/3] Processing interactions: %s", interactions_csv.name)
-            raw = extract_interactions_csv(interactions_csv)
-            transformed = [transform_interaction(r) for r in raw]
-            load_interactions(conn, transformed)
+            raw = iter_batches(extract_interactions_csv(interactions_csv), BATCH_SIZE)
+            load_interactions(conn, map(transform_interactions, raw))
         else:
             logger.warning("No interactions CSV found")
 
-        sysid_lookup: dict[tuple[str, str], dict[str, str]] = {}
+        sysid_lookup: dict[str, dict[str, str]] = {}
         if sysid_json and sysid_json.exists():
             logger.info("[2/3] Processing sys_ids: %s", sysid_json.name)
             sysid_records = extract_sysid_json(sysid_json)
@@ -615,16 +862,20 @@ def run_etl(
         if ims_inc_csv and ims_inc_csv.exists():
             logger.info("[3/3] Processing IMS-INC links: %s", ims_inc_csv.name)
             raw_links = extract_ims_inc_csv(ims_inc_csv)
-            transformed_links = [transform_ims_inc_link(r, sysid_lookup) for r in raw_links]
-            load_ims_inc_links(conn, transformed_links)
+            load_ims_inc_links(conn, (transform_ims_inc_link(r, sysid_lookup) for r in raw_links))
         else:
             logger.warning("No IMS-INC CSV found")
 
         logger.info("=" * 60)
         logger.info("ETL Pipeline Complete")
         logger.info("=" * 60)
+        completed = True
     finally:
-        conn.close()
+        try:
+            if initial_load:
+                rebuild_indexes(conn, completed)
+        finally:
+            conn.close()
 
 
 def show_stats() -> None:
@@ -654,6 +905,41 @@ def show_stats() -> None:
     conn.close()
 
 
+def emit_parquet(db_path: Path, output_dir: Path) -> None:
+    """Write a zstd-compressed Parquet copy of every star schema table.
+
+    Gives notebooks and other analytics tools a columnar mirror to scan
+    instead of aggregating over the SQLite row store. The bridge table is
+    exported through v_bridge_ims_inc so the derived ticket URLs are included.
+    Requires pandas and pyarrow.
+
+    Args:
+        db_path: Path to the SQLite database to export.
+        output_dir: Directory that receives one ``<table>.parquet`` per table.
+    """
+    import pandas as pd
+
+    sources = {
+        "dim_users": "dim_users",
+        "dim_technicians": "dim_technicians",
+        "dim_locations": "dim_locations",
+        "dim_states": "dim_states",
+        "dim_dates": "dim_dates",
+        "fact_interactions": "fact_interactions",
+        "bridge_ims_inc": "v_bridge_ims_inc",
+    }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        for name, source in sources.items():
+            df = pd.read_sql_query(f"SELECT * FROM {source}", conn)  # noqa: S608 - table names are internal constants
+            df.to_parquet(output_dir / f"{name}.parquet", compression="zstd", index=False)
+            logger.info("Wrote %d rows to %s.parquet", len(df), name)
+    finally:
+        conn.close()
+
+
 # =============================================================================
 # CLI
 # =============================================================================
@@ -671,6 +957,11 @@ def main() -> None:
         type=Path,
         help="Directory to search for export files (default: exports/)",
     )
+    parser.add_argument(
+        "--emit-parquet",
+        action="store_true",
+        help="After loading, write a Parquet copy of each table to parquet/",
+    )
 
     args = parser.parse_args()
 
@@ -683,6 +974,8 @@ def main() -> None:
             sysid_json=args.sysid,
             exports_dir=args.exports_dir,
         )
+        if args.emit_parquet:
+            emit_parquet(DB_PATH, PARQUET_DIR)
         show_stats()
 
 